@@ -8,6 +8,28 @@ class Config:
     BASE_URL = os.getenv("BASE_URL")
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 10))
 
+    # Client-side CPU profiling (pytest --cpu-profile=PATH)
+    CPU_PROFILE_INTERVAL = float(os.getenv("CPU_PROFILE_INTERVAL", 0.005))
+    CPU_PROFILE_TOP = int(os.getenv("CPU_PROFILE_TOP", 10))
+
+    # Compression benchmark: max bytes on the wire per response, and the body
+    # size above which serving it uncompressed is flagged
+    PAYLOAD_SIZE_BUDGET = int(os.getenv("PAYLOAD_SIZE_BUDGET", 51200))
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+
+    # Live load metrics: terminal dashboard toggle, /metrics port (0 = off),
+    # rolling percentile window (seconds) and per-worker ring buffer size
+    METRICS_DASHBOARD = os.getenv("METRICS_DASHBOARD", "false").lower() == "true"
+    METRICS_PORT = int(os.getenv("METRICS_PORT", 0))
+    METRICS_WINDOW = float(os.getenv("METRICS_WINDOW", 10))
+    METRICS_BUFFER_SIZE = int(os.getenv("METRICS_BUFFER_SIZE", 4096))
+
+    # Transport for request helpers / load engine: "http1" (requests) or "http2" (httpx),
+    # plus HTTP/2 pool size and concurrent streams allowed per connection
+    HTTP_TRANSPORT = os.getenv("HTTP_TRANSPORT", "http1")
+    H2_CONNECTIONS = int(os.getenv("H2_CONNECTIONS", 2))
+    H2_STREAMS_PER_CONNECTION = int(os.getenv("H2_STREAMS_PER_CONNECTION", 50))
+
     ENDPOINTS = {
         "login": os.getenv("ENDPOINT_LOGIN"),
         "logout": os.getenv("ENDPOINT_LOGOUT"),
@@ -18,6 +40,27 @@ class Config:
         "delete_category": os.getenv("ENDPOINT_DELETE_CATEGORY"),
     }
 
+    # HTTP method each endpoint key is normally called with (several keys share a path)
+    ENDPOINT_METHODS = {
+        "login": "post",
+        "logout": "post",
+        "protected_endpoint": "get",
+        "create_category": "post",
+        "list_categories": "post",
+        "update_category": "put",
+        "delete_category": "delete",
+    }
+
+    # Deployable services -> endpoint keys they own (used by --changed-services)
+    SERVICES = {
+        "auth": ["login", "logout"],
+        "category": ["protected_endpoint", "create_category", "list_categories", "update_category",
+                     "delete_category"],
+    }
+
+    # Endpoint-to-test index written on every run, read by --changed-endpoints / --select-failed
+    ENDPOINT_INDEX_PATH = os.getenv("ENDPOINT_INDEX_PATH", ".endpoint_index.json")
+
     ADMIN_EMAIL = os.getenv("ADMIN_EMAIL")
     ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
     ADMIN_ROLE = os.getenv("ADMIN_ROLE")
@@ -1,4 +1,5 @@
 from Api.Automation.Src.Config.config import Config
+from Api.Automation.Src.Utils.transport_utils import get_transport
 import requests
 
 
@@ -21,10 +22,16 @@ def get_login_payload(email=None, password=None, role=None):
     }
 
 
-def api_request(method, endpoint_key="login", payload=None, headers=None, use_timeout=True):
+def api_request(method, endpoint_key="login", payload=None, headers=None, use_timeout=True, transport=None):
+    """
+    Send a request to a configured endpoint. `transport` ("http1"/"http2") defaults
+    to Config.HTTP_TRANSPORT; see transport_utils.
+    """
     url = build_url(endpoint_key)
     hdrs = headers or Config.HEADERS
     timeout = Config.REQUEST_TIMEOUT if use_timeout else None
-    return getattr(requests, method)(url, json=payload, headers=hdrs, timeout=timeout)
+    if (transport or Config.HTTP_TRANSPORT) == "http1":
+        return getattr(requests, method)(url, json=payload, headers=hdrs, timeout=timeout)
+    return get_transport(transport).request(method, url, json=payload, headers=hdrs, timeout=timeout)
 
 
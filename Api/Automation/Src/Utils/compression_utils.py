@@ -0,0 +1,143 @@
+"""
+Response Compression Benchmark
+------------------------------
+Requests an endpoint with a given Accept-Encoding and measures:
+- bytes on the wire vs. decoded size
+- server time (request sent -> response headers received)
+- client-side decompression time
+
+Runs against whatever Config.BASE_URL points at (live API or a local stand-in).
+Brotli ("br") is only benchmarked when the optional `brotli` package is installed.
+
+Example:
+    result = benchmark_endpoint("list_categories", "gzip", headers=Config.HEADERS)
+    # {"endpoint": "list_categories", "encoding": "gzip", "content_encoding": "gzip",
+    #  "status": 200, "wire_bytes": 812, "decoded_bytes": 5120,
+    #  "server_ms": 143.2, "decompress_ms": 0.1}
+"""
+
+import gzip
+import time
+import zlib
+
+import requests
+from Api.Automation.Src.Config.config import Config
+from Api.Automation.Src.Services.login_service import build_url, get_login_payload
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+ENCODINGS = ["identity", "gzip", "deflate"] + (["br"] if brotli else [])
+
+# Used for "{id}" endpoints so the benchmark never touches real records
+PLACEHOLDER_ID = "00000000-0000-0000-0000-000000000000"
+
+# endpoint key -> (payload factory, send auth headers); methods come from Config.ENDPOINT_METHODS.
+# Mutating endpoints get an empty body / placeholder id so server state is never
+# changed, and logout goes without the session token so it can't revoke it. Those
+# calls usually answer with 4xx error bodies, which are reported but not judged.
+BENCHMARK_REQUESTS = {
+    "login": (get_login_payload, False),
+    "logout": (lambda: None, False),
+    "protected_endpoint": (lambda: None, True),
+    "create_category": (lambda: {}, True),
+    "list_categories": (lambda: None, True),
+    "update_category": (lambda: {}, True),
+    "delete_category": (lambda: None, True),
+}
+
+
+def decompress(body, content_encoding):
+    """Decode a raw response body according to its Content-Encoding."""
+    if content_encoding in ("", "identity"):
+        return body
+    if content_encoding == "gzip":
+        return gzip.decompress(body)
+    if content_encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:  # some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    if content_encoding == "br" and brotli is not None:
+        return brotli.decompress(body)
+    raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+def is_payload(result):
+    """Only 2xx bodies are real endpoint payloads; error bodies are not judged."""
+    return 200 <= result["status"] < 300
+
+
+def benchmark_endpoint(endpoint_key, encoding, headers=None, base_url=None):
+    """
+    Request one endpoint with one Accept-Encoding and return size/timing details.
+    `base_url` overrides Config.BASE_URL (e.g. a local stand-in).
+    """
+    payload_factory, use_auth = BENCHMARK_REQUESTS.get(endpoint_key, (lambda: None, True))
+    method = Config.ENDPOINT_METHODS.get(endpoint_key, "get")
+    url = (base_url.rstrip("/") + Config.ENDPOINTS[endpoint_key] if base_url
+           else build_url(endpoint_key)).format(id=PLACEHOLDER_ID)
+    hdrs = {**(headers or {}), "Accept-Encoding": encoding} if use_auth else {"Accept-Encoding": encoding}
+
+    resp = requests.request(method, url, json=payload_factory(), headers=hdrs,
+                            timeout=Config.REQUEST_TIMEOUT, stream=True)
+    raw = resp.raw.read(decode_content=False)  # exact bytes on the wire (minus headers)
+    resp.close()
+    content_encoding = resp.headers.get("Content-Encoding", "identity").strip().lower()
+
+    start = time.perf_counter()
+    decoded = decompress(raw, content_encoding)
+    decompress_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "endpoint": endpoint_key,
+        "encoding": encoding,
+        "content_encoding": content_encoding,
+        "status": resp.status_code,
+        "wire_bytes": len(raw),
+        "decoded_bytes": len(decoded),
+        "server_ms": resp.elapsed.total_seconds() * 1000,
+        "decompress_ms": decompress_ms,
+    }
+
+
+def find_issues(results, size_budget=None, min_compress_size=None):
+    """
+    Flag problems in one endpoint's results (one dict per encoding):
+    - a compressible body (>= min_compress_size) never compressed, whatever encoding was offered
+    - even the smallest wire size exceeds size_budget
+    Only 2xx results are judged; error bodies and encodings the server merely
+    doesn't support (e.g. deflate) show up in the report only.
+    """
+    size_budget = Config.PAYLOAD_SIZE_BUDGET if size_budget is None else size_budget
+    min_compress_size = Config.COMPRESSION_MIN_SIZE if min_compress_size is None else min_compress_size
+    issues = []
+    results = [r for r in results if is_payload(r)]
+
+    offered = [r for r in results if r["encoding"] != "identity"]
+    if offered and all(r["content_encoding"] == "identity" for r in offered):
+        largest = max(r["decoded_bytes"] for r in offered)
+        if largest >= min_compress_size:
+            issues.append(f"{offered[0]['endpoint']}: ignores compression ({largest} bytes always sent uncompressed)")
+
+    if results:
+        best = min(results, key=lambda r: r["wire_bytes"])
+        if best["wire_bytes"] > size_budget:
+            issues.append(f"{best['endpoint']}: {best['wire_bytes']} bytes on the wire "
+                          f"(best: {best['content_encoding']}) exceeds budget of {size_budget} bytes")
+    return issues
+
+
+def format_report(results):
+    """Render benchmark results as a fixed-width table."""
+    lines = [f"{'endpoint':<20} {'accept':<9} {'served':<9} {'status':>6} {'wire':>9} "
+             f"{'decoded':>9} {'ratio':>6} {'server ms':>10} {'decomp ms':>10}"]
+    for r in results:
+        ratio = r["wire_bytes"] / r["decoded_bytes"] if r["decoded_bytes"] else 1.0
+        note = "" if is_payload(r) else "  (error body, not judged)"
+        lines.append(f"{r['endpoint']:<20} {r['encoding']:<9} {r['content_encoding']:<9} {r['status']:>6} "
+                     f"{r['wire_bytes']:>9} {r['decoded_bytes']:>9} {ratio:>6.2f} "
+                     f"{r['server_ms']:>10.1f} {r['decompress_ms']:>10.2f}{note}")
+    return "\n".join(lines)
@@ -0,0 +1,226 @@
+"""
+Client-side CPU Profiler
+------------------------
+Opt-in pytest plugin that samples every thread's stack while a test runs, so a
+slow test can be split into time spent waiting on the API (sockets) and time
+spent inside our own harness (JSON printing, schema validation, URL building...).
+
+Usage:
+    pytest ./Api/Automation/Tests/ --cpu-profile=./cpu_profile.folded
+
+Output:
+    cpu_profile.folded   Collapsed stacks ("frame;frame;frame count" per line),
+                         rooted at the test id - feed to flamegraph.pl / speedscope
+    Terminal summary     Per-test wall time, CPU seconds and socket-wait / idle
+                         thread-seconds, and the top harness hotspots across the run
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+# Api/Automation - frames under this directory are "harness" frames
+HARNESS_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Frames in these files mean the thread is blocked on the network. Matched as path
+# suffixes so HTTP client backends (urllib3, httpcore for HTTP/2) are covered too.
+SOCKET_WAIT_PATHS = ("/socket.py", "/ssl.py", "/selectors.py",
+                     "/urllib3/util/connection.py", "/httpcore/_backends/sync.py")
+# ...as do these leaf functions (C-level connect() is invisible to the sampler)
+SOCKET_WAIT_FUNCS = ("create_connection",)
+# Pass-through instrumentation wrappers (e.g. the endpoint index's Session.request
+# hook) - never credited as hotspots
+INSTRUMENTATION_FILES = (
+    os.path.join(HARNESS_ROOT, "Src", "Utils", "endpoint_index_utils.py"),
+    os.path.abspath(__file__),
+)
+# CPU spent in HTTP client libraries is reported as its own hotspot instead of
+# being credited to whichever harness wrapper (transport, api_request) called it
+HTTP_CLIENT_PACKAGES = ("/requests/", "/urllib3/", "/httpx/", "/httpcore/", "/h2/", "/hpack/", "/hyperframe/",
+                        "/http/client.py")
+HTTP_CLIENT_LABEL = "[HTTP client libraries]"
+# Leaf frames in these modules mean the thread is parked (thread pool, events)
+IDLE_MODULES = ("threading.py", "queue.py", "thread.py")
+# Helper threads started by the harness itself - not part of the client under test
+IGNORED_THREADS = ("cpu-profile-sampler", "stand-in-server", "metrics-dashboard", "metrics-server")
+
+
+def _is_harness(filename):
+    return filename.startswith(HARNESS_ROOT)
+
+
+def _frame_label(filename, name):
+    if _is_harness(filename):
+        return f"{os.path.relpath(filename, HARNESS_ROOT)}:{name}"
+    return f"{os.path.basename(filename)}:{name}"
+
+
+def _is_socket_frame(filename):
+    return filename.replace("\\", "/").endswith(SOCKET_WAIT_PATHS)
+
+
+def _is_http_client_frame(filename):
+    filename = filename.replace("\\", "/")
+    return any(package in filename for package in HTTP_CLIENT_PACKAGES)
+
+
+def classify_stack(stack, cpu_delta=None, interval=None):
+    """
+    Return 'socket', 'idle' or 'cpu' for a leaf-first stack of (filename, name).
+
+    When the thread's CPU clock delta since the previous sample is known, a thread
+    that barely used the CPU is waiting even if it sits in a C call the sampler
+    cannot see (e.g. sock.recv): it is socket wait when a network frame is on its
+    stack, idle otherwise.
+    """
+    leaf_file, leaf_name = stack[0]
+    if _is_socket_frame(leaf_file) or leaf_name in SOCKET_WAIT_FUNCS:
+        return "socket"
+    if os.path.basename(leaf_file) in IDLE_MODULES:
+        return "idle"
+    if cpu_delta is not None and cpu_delta < interval / 2:
+        return "socket" if any(_is_socket_frame(filename) for filename, _ in stack) else "idle"
+    return "cpu"
+
+
+def _thread_cpu_time(ident):
+    """Per-thread CPU seconds, or None where the platform has no per-thread clocks (Windows)."""
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError):
+        return None
+
+
+def harness_hotspot(stack):
+    """
+    Return the innermost harness frame label of a leaf-first stack, HTTP_CLIENT_LABEL
+    when an HTTP client library frame sits below it, or None.
+    """
+    for filename, name in stack:
+        if _is_http_client_frame(filename):
+            return HTTP_CLIENT_LABEL
+        if _is_harness(filename) and filename not in INSTRUMENTATION_FILES:
+            return _frame_label(filename, name)
+    return None
+
+
+def _ignored_thread_idents():
+    return {thread.ident for thread in threading.enumerate() if thread.name.startswith(IGNORED_THREADS)}
+
+
+class StackSampler:
+    """Background thread that snapshots all other threads every `interval` seconds."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.stacks = Counter()  # (bucket, leaf-first tuple of (filename, name)) -> samples
+        self.cpu_seconds = 0.0   # CPU used by the sampled threads
+        self._cpu_seen = {}      # thread ident -> CPU clock at previous sample
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        for thread in threading.enumerate():  # baseline, so the first sample has a CPU delta
+            self._cpu_seen[thread.ident] = _thread_cpu_time(thread.ident)
+        self._thread = threading.Thread(target=self._run, name="cpu-profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def seconds(self, bucket):
+        """Thread-seconds spent in `bucket` (samples x interval, summed over threads)."""
+        return self.interval * sum(count for (b, _), count in self.stacks.items() if b == bucket)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            ignored = _ignored_thread_idents()
+            for ident, frame in sys._current_frames().items():
+                if ident in ignored:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append((frame.f_code.co_filename, frame.f_code.co_name))
+                    frame = frame.f_back
+                cpu_now = _thread_cpu_time(ident)
+                cpu_prev = self._cpu_seen.get(ident)
+                cpu_delta = cpu_now - cpu_prev if cpu_now is not None and cpu_prev is not None else None
+                self._cpu_seen[ident] = cpu_now
+                bucket = classify_stack(stack, cpu_delta, self.interval)
+                self.stacks[(bucket, tuple(stack))] += 1
+                # no per-thread clock: estimate from the samples that were on-CPU
+                self.cpu_seconds += cpu_delta if cpu_delta is not None else self.interval * (bucket == "cpu")
+
+
+class CpuProfilePlugin:
+    """Pytest plugin registered from conftest.py when --cpu-profile is given."""
+
+    def __init__(self, output_path, interval, top=10):
+        self.output_path = output_path
+        self.interval = interval
+        self.top = top
+        self.profiles = {}  # nodeid -> dict(wall, cpu, socket, idle, stacks)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        sampler = StackSampler(self.interval)
+        wall_start = time.perf_counter()
+        sampler.start()
+        yield
+        sampler.stop()
+        self.profiles[item.nodeid] = {
+            "wall": time.perf_counter() - wall_start,
+            "cpu": sampler.cpu_seconds,
+            "socket": sampler.seconds("socket"),
+            "idle": sampler.seconds("idle"),
+            "stacks": sampler.stacks,
+        }
+
+    def collapsed_lines(self):
+        """Yield flamegraph collapsed-stack lines, trimmed to start at the outermost harness frame."""
+        for nodeid, profile in self.profiles.items():
+            root = nodeid.replace(";", "_").replace(" ", "_")
+            for (bucket, stack), count in profile["stacks"].items():
+                frames = list(reversed(stack))  # root-first
+                harness_idx = [i for i, (filename, _) in enumerate(frames) if _is_harness(filename)]
+                if harness_idx:
+                    frames = frames[harness_idx[0]:]
+                labels = [_frame_label(filename, name).replace(";", "_").replace(" ", "_")
+                          for filename, name in frames]
+                yield f"{root};{bucket};{';'.join(labels)} {count}"
+
+    def pytest_sessionfinish(self, session):
+        with open(self.output_path, "w", encoding="utf-8") as fh:
+            for line in self.collapsed_lines():
+                fh.write(line + "\n")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        tr = terminalreporter
+        tr.write_sep("-", "client-side CPU profile")
+        tr.write_line("cpu / socket / idle are seconds summed over the test's threads, so with a thread pool "
+                      "they can exceed wall")
+        tr.write_line(f"{'wall(s)':>8} {'cpu(s)':>8} {'socket(s)':>10} {'idle(s)':>8}  test")
+
+        hotspots = Counter()
+        slowest = sorted(self.profiles.items(), key=lambda kv: kv[1]["wall"], reverse=True)
+        for rank, (nodeid, profile) in enumerate(slowest):
+            for (bucket, stack), count in profile["stacks"].items():
+                if bucket == "cpu":
+                    spot = harness_hotspot(stack)
+                    if spot:
+                        hotspots[spot] += count
+            if rank < self.top:
+                tr.write_line(f"{profile['wall']:>8.2f} {profile['cpu']:>8.2f} {profile['socket']:>10.2f} "
+                              f"{profile['idle']:>8.2f}  {nodeid}")
+
+        tr.write_line("")
+        tr.write_line(f"Top harness hotspots (CPU samples @ {self.interval * 1000:.0f} ms):")
+        for label, count in hotspots.most_common(self.top):
+            tr.write_line(f"{count:>8}  ~{count * self.interval:.2f}s  {label}")
+        tr.write_line(f"Collapsed stacks written to: {self.output_path}")
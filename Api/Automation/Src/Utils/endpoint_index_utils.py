@@ -0,0 +1,214 @@
+"""
+Endpoint-to-Test Index
+----------------------
+Pytest plugin that records which Config.ENDPOINTS keys every test touches and
+uses that index to run only the tests affected by a change.
+
+Recording (every run):
+    All HTTP calls made through `requests` (api_request, safe_request, get_jwt_token,
+    direct requests.post ...) or the HTTP/2 transport are matched back to endpoint keys. Calls made inside a
+    fixture are credited to every test that uses the fixture, so the autouse
+    `authenticate` fixture ties all tests to "login". Only URLs on Config.BASE_URL
+    count - calls to a local stand-in are not the live endpoints. The index is merged
+    into Config.ENDPOINT_INDEX_PATH (relative to the pytest rootdir) at the end of the
+    session: a passing run replaces a test's endpoint list, a failing or skipped run
+    only adds to it (it may have stopped before its later calls). --collect-only runs
+    neither record nor write.
+
+Selection:
+    pytest ./Api/Automation/Tests/ --changed-endpoints=list_categories,update_category
+    pytest ./Api/Automation/Tests/ --changed-services=category
+    pytest ./Api/Automation/Tests/ --select-failed
+
+    Affected tests (plus tests not in the index yet, plus tests whose last recorded
+    outcome is "failed") run in collection order, which keeps class-scoped flows like
+    create -> update -> delete intact. The rest are deselected and reuse their cached
+    passing result. Known failures are always re-run, so a selective run can never
+    report green while one is outstanding; --select-failed on its own runs just those.
+"""
+
+import json
+import os
+import re
+import time
+from functools import lru_cache
+
+import pytest
+import requests
+from Api.Automation.Src.Config.config import Config
+from Api.Automation.Src.Utils.transport_utils import Http2Transport
+
+_original_request = requests.sessions.Session.request
+_original_h2_request = Http2Transport.request
+_active_sinks = []  # stack of sets currently collecting endpoint keys
+
+
+@lru_cache(maxsize=None)
+def _endpoint_patterns():
+    patterns = []
+    for key, template in Config.ENDPOINTS.items():
+        if not template:
+            continue
+        regex = re.escape(template).replace(re.escape("{id}"), "[^/]+")
+        patterns.append((key, re.compile(regex + "/?$")))
+    return tuple(patterns)
+
+
+def match_endpoint(method, url, patterns=None):
+    """Return the endpoint keys a request (method, url) on Config.BASE_URL corresponds to."""
+    parsed = requests.utils.urlparse(url)
+    base = requests.utils.urlparse(Config.BASE_URL or "")
+    if (parsed.scheme, parsed.netloc) != (base.scheme, base.netloc):
+        return []  # another host, e.g. the local stand-in server
+    path = parsed.path
+    candidates = [key for key, regex in (patterns or _endpoint_patterns()) if regex.search(path)]
+    by_method = [key for key in candidates if Config.ENDPOINT_METHODS.get(key) == method.lower()]
+    # Same path under several keys (e.g. category/{id}): narrow by method when possible
+    return by_method or candidates
+
+
+def record_endpoint_call(method, url):
+    """Credit a call to whatever test/fixture is currently recording (no-op otherwise)."""
+    if _active_sinks:
+        _active_sinks[-1].update(match_endpoint(method, url))
+
+
+def _recording_request(session, method, url, *args, **kwargs):
+    record_endpoint_call(method, url)
+    return _original_request(session, method, url, *args, **kwargs)
+
+
+def _recording_h2_request(transport, method, url, **kwargs):
+    # httpx bypasses requests.Session, so the HTTP/2 transport is hooked separately
+    record_endpoint_call(method, url)
+    return _original_h2_request(transport, method, url, **kwargs)
+
+
+def load_index(path):
+    if not os.path.exists(path):
+        return {"fixtures": {}, "tests": {}}
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def expand_changed(endpoints=None, services=None):
+    """Turn --changed-endpoints / --changed-services values into a set of endpoint keys."""
+    changed = set(endpoints or [])
+    for service in services or []:
+        if service not in Config.SERVICES:
+            raise ValueError(f"Invalid service: {service} (known: {', '.join(Config.SERVICES)})")
+        changed.update(Config.SERVICES[service])
+    unknown = changed - set(Config.ENDPOINTS)
+    if unknown:
+        raise ValueError(f"Invalid endpoint_key: {', '.join(sorted(unknown))}")
+    return changed
+
+
+class EndpointIndexPlugin:
+    """Registered from conftest.py on every run."""
+
+    def __init__(self, index_path, changed=None, select_failed=False, record=True):
+        self.index_path = index_path
+        self.record = record  # False for --collect-only: leave requests and the index file alone
+        self.index = load_index(index_path)
+        self.changed = changed or set()
+        self.select_failed = select_failed
+        self.fixture_endpoints = {}  # fixture name -> set of keys (this run)
+        self.test_endpoints = {}     # nodeid -> set of keys from the test body (this run)
+        self.outcomes = {}           # nodeid -> "passed" / "failed" / "skipped"
+        self.items = {}              # nodeid -> item (this run)
+        self.cached = {}             # nodeid -> cached entry for deselected tests
+
+    @property
+    def selecting(self):
+        return bool(self.changed) or self.select_failed
+
+    # ---------- recording ----------
+    def pytest_sessionstart(self, session):
+        if self.record:
+            requests.sessions.Session.request = _recording_request
+            Http2Transport.request = _recording_h2_request
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        if getattr(fixturedef.func, "__name__", "") == "get_direct_param_fixture_func":
+            yield  # a @pytest.mark.parametrize argument, not a real fixture
+            return
+        sink = self.fixture_endpoints.setdefault(fixturedef.argname, set())
+        _active_sinks.append(sink)
+        yield
+        _active_sinks.pop()
+
+    def _record_phase(self, item):
+        sink = self.test_endpoints.setdefault(item.nodeid, set())
+        _active_sinks.append(sink)
+        yield
+        _active_sinks.pop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._record_phase(item)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield from self._record_phase(item)
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self.outcomes[report.nodeid] = "failed"
+        elif report.when == "call" or report.skipped:
+            self.outcomes.setdefault(report.nodeid, report.outcome)
+
+    # ---------- selection ----------
+    def is_affected(self, item):
+        entry = self.index["tests"].get(item.nodeid)
+        if entry is None:
+            return True  # never recorded - can't prove it is unaffected
+        if entry.get("outcome") == "failed":
+            return True  # a cached failure must not be reported as a green run
+        return bool(self.changed & set(entry.get("endpoints", [])))
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        self.items = {item.nodeid: item for item in items}
+        if not self.selecting:
+            return
+        selected, deselected = [], []
+        for item in items:
+            (selected if self.is_affected(item) else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            self.cached = {item.nodeid: self.index["tests"][item.nodeid] for item in deselected}
+        items[:] = selected
+
+    # ---------- persistence / report ----------
+    def pytest_sessionfinish(self, session):
+        if not self.record:
+            return
+        requests.sessions.Session.request = _original_request
+        Http2Transport.request = _original_h2_request
+        fixtures = self.index.setdefault("fixtures", {})
+        for name, keys in self.fixture_endpoints.items():
+            fixtures[name] = sorted(keys)
+
+        tests = self.index.setdefault("tests", {})
+        for nodeid, outcome in self.outcomes.items():
+            item = self.items.get(nodeid)
+            keys = set(self.test_endpoints.get(nodeid, set()))
+            for name in getattr(item, "fixturenames", []):
+                keys.update(fixtures.get(name, []))
+            if outcome != "passed":
+                keys.update(tests.get(nodeid, {}).get("endpoints", []))
+            tests[nodeid] = {"endpoints": sorted(keys), "outcome": outcome, "recorded_at": time.time()}
+
+        with open(self.index_path, "w", encoding="utf-8") as fh:
+            json.dump(self.index, fh, indent=2, sort_keys=True)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.selecting:
+            return
+        tr = terminalreporter
+        tr.write_sep("-", "endpoint-based selection")
+        reason = ", ".join(sorted(self.changed)) or "-"
+        tr.write_line(f"Changed endpoints: {reason} (+ last failures)")
+        tr.write_line(f"Ran {len(self.items) - len(self.cached)} affected test(s), "
+                      f"reused {len(self.cached)} cached result(s)")
@@ -0,0 +1,87 @@
+"""
+Load Engine
+-----------
+Fires many concurrent requests through a chosen transport and feeds the live
+metrics (see metrics_utils). Used by the parallel login tests and by the
+HTTP/1.1 vs. HTTP/2 benchmark.
+
+Example:
+    results, total_time, metrics = run_load("post", build_url(), payload, num_requests=50, transport="http2")
+    print(format_transport_comparison(compare_transports("post", build_url(), payload)))
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from Api.Automation.Src.Utils.metrics_utils import LoadMetrics, live_dashboard
+from Api.Automation.Src.Utils.transport_utils import TRANSPORTS, get_transport, http_version
+
+
+def run_load(method, url, payload=None, num_requests=50, concurrency=None, transport=None,
+             timeout=None, endpoint_key="login", headers=None, protocols=None):
+    """
+    Send `num_requests` requests with `concurrency` worker threads (default: one per request).
+    `transport` is a transport name ("http1"/"http2") or a transport instance.
+    If `protocols` (a set) is given, the negotiated HTTP version of every response is added to it.
+    Returns (results, total_time, metrics); results are (index, status, duration) tuples.
+    """
+    client = transport if hasattr(transport, "request") else get_transport(transport)
+    metrics = LoadMetrics()
+    results = []
+
+    def worker(index):
+        start = time.time()
+        started = metrics.start_request()
+        try:
+            resp = client.request(method, url, json=payload, headers=headers, timeout=timeout)
+            metrics.finish_request(endpoint_key, resp.status_code, started)
+            if protocols is not None:
+                protocols.add(http_version(resp))
+            return index, resp.status_code, time.time() - start
+        except Exception as e:
+            metrics.finish_request(endpoint_key, type(e).__name__, started)
+            return index, f"Error: {e}", time.time() - start
+
+    start_all = time.time()
+    with live_dashboard(metrics), ThreadPoolExecutor(max_workers=concurrency or num_requests) as executor:
+        futures = [executor.submit(worker, i) for i in range(num_requests)]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results, time.time() - start_all, metrics
+
+
+def compare_transports(method, url, payload=None, num_requests=50, concurrency=None, transports=TRANSPORTS,
+                       timeout=None, endpoint_key="login", headers=None):
+    """
+    Run the same load scenario once per transport and summarise each run. Each row
+    records the HTTP versions actually negotiated, since https can fall back from
+    HTTP/2 to HTTP/1.1 through ALPN without any error.
+    """
+    rows = []
+    for transport in transports:
+        protocols = set()
+        results, total_time, metrics = run_load(method, url, payload, num_requests, concurrency, transport,
+                                                timeout, endpoint_key, headers, protocols)
+        snap = metrics.snapshot()
+        stats = snap["endpoints"].get(endpoint_key, {"p50": 0.0, "p99": 0.0})
+        rows.append({
+            "transport": transport if isinstance(transport, str) else transport.name,
+            "http_versions": sorted(protocols),
+            "requests": len(results),
+            "errors": sum(snap["errors"].values()),
+            "total_time": total_time,
+            "rps": len(results) / total_time if total_time else 0.0,
+            "p50": stats["p50"],
+            "p99": stats["p99"],
+        })
+    return rows
+
+
+def format_transport_comparison(rows):
+    lines = [f"{'transport':<10} {'protocol':<10} {'requests':>8} {'errors':>7} {'total s':>8} {'req/s':>8} "
+             f"{'p50 ms':>8} {'p99 ms':>8}"]
+    for r in rows:
+        protocol = ",".join(r["http_versions"]) or "-"
+        lines.append(f"{r['transport']:<10} {protocol:<10} {r['requests']:>8} {r['errors']:>7} {r['total_time']:>8.2f} "
+                     f"{r['rps']:>8.1f} {r['p50'] * 1000:>8.1f} {r['p99'] * 1000:>8.1f}")
+    return "\n".join(lines)
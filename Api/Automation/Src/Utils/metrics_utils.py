@@ -0,0 +1,227 @@
+"""
+Live Load Metrics
+-----------------
+Low-overhead request metrics for load / soak runs:
+- every worker thread writes into its own fixed-size ring buffer (no locks on the hot path)
+- a dashboard thread reads all buffers once a second and redraws RPS, in-flight
+  requests, rolling p50/p99 per endpoint key and an error breakdown by status
+- optionally serves the same numbers as Prometheus text on http://127.0.0.1:<port>/metrics
+
+Usage:
+    metrics = LoadMetrics()
+    with live_dashboard(metrics):
+        started = metrics.start_request()
+        resp = requests.post(url, json=payload)
+        metrics.finish_request("login", resp.status_code, started)
+    print(format_dashboard(metrics.snapshot()))
+
+Dashboard / endpoint are toggled with METRICS_DASHBOARD and METRICS_PORT in .env.
+"""
+
+import math
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from Api.Automation.Src.Config.config import Config
+
+
+class RingBuffer:
+    """
+    Per-worker sample buffer. Only its owning thread writes to it, so no lock is
+    needed; readers copy the slots and tolerate a sample being overwritten mid-read.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.slots = [None] * size  # (finished_at, endpoint_key, status, duration)
+        self.writes = 0
+        self.started = 0
+        self.finished = 0
+        self.totals = Counter()  # (endpoint_key, status) -> requests, never wraps
+
+    def append(self, sample):
+        self.slots[self.writes % self.size] = sample
+        self.writes += 1
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+def is_error(status):
+    return not isinstance(status, int) or status >= 400
+
+
+class LoadMetrics:
+    """Collects request samples from many worker threads into per-thread ring buffers."""
+
+    def __init__(self, buffer_size=None, window=None):
+        self.buffer_size = buffer_size or Config.METRICS_BUFFER_SIZE
+        self.window = window or Config.METRICS_WINDOW
+        self.started_at = time.monotonic()
+        self._buffers = []
+        self._local = threading.local()
+        self._register_lock = threading.Lock()  # taken once per worker thread, not per request
+
+    def _buffer(self):
+        buf = getattr(self._local, "buffer", None)
+        if buf is None:
+            buf = self._local.buffer = RingBuffer(self.buffer_size)
+            with self._register_lock:
+                self._buffers.append(buf)
+        return buf
+
+    def start_request(self):
+        """Mark a request as in flight; returns the start timestamp for finish_request()."""
+        self._buffer().started += 1
+        return time.monotonic()
+
+    def finish_request(self, endpoint_key, status, started):
+        """Record a completed request. `status` is the HTTP code or an error label."""
+        now = time.monotonic()
+        buf = self._buffer()
+        buf.append((now, endpoint_key, status, now - started))
+        buf.totals[(endpoint_key, status)] += 1
+        buf.finished += 1
+
+    def snapshot(self):
+        """Aggregate all worker buffers into one point-in-time view."""
+        now = time.monotonic()
+        buffers = list(self._buffers)
+        in_flight = 0
+        last_second = 0
+        durations = defaultdict(list)
+        totals = Counter()
+
+        for buf in buffers:
+            in_flight += buf.started - buf.finished
+            totals.update(dict(buf.totals))
+            for sample in list(buf.slots):
+                if sample is None or now - sample[0] > self.window:
+                    continue
+                finished_at, endpoint_key, _, duration = sample
+                durations[endpoint_key].append(duration)
+                if now - finished_at <= 1.0:
+                    last_second += 1
+
+        endpoints = {}
+        for endpoint_key, values in durations.items():
+            values.sort()
+            endpoints[endpoint_key] = {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p99": percentile(values, 99),
+            }
+
+        errors = Counter()
+        for (_, status), count in totals.items():
+            if is_error(status):
+                errors[status] += count
+
+        return {
+            "elapsed": now - self.started_at,
+            "rps": last_second,
+            "in_flight": max(in_flight, 0),
+            "total": sum(totals.values()),
+            "endpoints": endpoints,
+            "totals": totals,
+            "errors": errors,
+            "window": self.window,
+        }
+
+
+def format_dashboard(snap):
+    """Render a snapshot as a compact text table."""
+    lines = [
+        f"elapsed {snap['elapsed']:7.1f}s | rps {snap['rps']:5d} | in-flight {snap['in_flight']:4d} "
+        f"| total {snap['total']:6d} | errors {sum(snap['errors'].values()):5d}",
+        f"{'endpoint':<20} {'n(' + str(int(snap['window'])) + 's)':>8} {'p50 ms':>9} {'p99 ms':>9}",
+    ]
+    for endpoint_key, stats in sorted(snap["endpoints"].items()):
+        lines.append(f"{endpoint_key:<20} {stats['count']:>8} {stats['p50'] * 1000:>9.1f} {stats['p99'] * 1000:>9.1f}")
+    if snap["errors"]:
+        breakdown = ", ".join(f"{status}: {count}" for status, count in snap["errors"].most_common())
+        lines.append(f"errors by status -> {breakdown}")
+    return "\n".join(lines)
+
+
+def format_prometheus(snap):
+    """Render a snapshot in the Prometheus text exposition format."""
+    lines = ["# TYPE api_requests_total counter"]
+    for (endpoint_key, status), count in sorted(snap["totals"].items(), key=str):
+        lines.append(f'api_requests_total{{endpoint="{endpoint_key}",status="{status}"}} {count}')
+    lines += ["# TYPE api_requests_in_flight gauge", f"api_requests_in_flight {snap['in_flight']}",
+              "# TYPE api_requests_per_second gauge", f"api_requests_per_second {snap['rps']}",
+              "# TYPE api_request_duration_seconds summary"]
+    for endpoint_key, stats in sorted(snap["endpoints"].items()):
+        lines.append(f'api_request_duration_seconds{{endpoint="{endpoint_key}",quantile="0.5"}} {stats["p50"]:.6f}')
+        lines.append(f'api_request_duration_seconds{{endpoint="{endpoint_key}",quantile="0.99"}} {stats["p99"]:.6f}')
+    return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(metrics, port):
+    """Serve GET /metrics on 127.0.0.1:<port> from a daemon thread; returns the server."""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = format_prometheus(metrics.snapshot()).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # keep the terminal for the dashboard
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
+
+
+@contextmanager
+def live_dashboard(metrics, enabled=None, port=None, refresh=1.0, out=None):
+    """Redraw the dashboard every `refresh` seconds (and serve /metrics) while the block runs."""
+    enabled = Config.METRICS_DASHBOARD if enabled is None else enabled
+    port = Config.METRICS_PORT if port is None else port
+    stop = threading.Event()
+    out = out or sys.__stdout__  # bypass pytest output capture
+    redraw = out.isatty()
+
+    def render_loop():
+        drawn = 0  # lines of the previous frame
+        while not stop.wait(refresh):
+            text = format_dashboard(metrics.snapshot())
+            if redraw:
+                # move up over our own previous frame and erase it - the rest of the terminal stays
+                prefix = f"\x1b[{drawn}F\x1b[J" if drawn else ""
+                drawn = text.count("\n") + 1
+            else:
+                prefix = "\n"
+            out.write(prefix + text + "\n")
+            out.flush()
+
+    server = start_metrics_server(metrics, port) if port else None
+    thread = threading.Thread(target=render_loop, name="metrics-dashboard", daemon=True) if enabled else None
+    if thread:
+        thread.start()
+    try:
+        yield metrics
+    finally:
+        stop.set()
+        if thread:
+            thread.join()
+        if server:
+            server.shutdown()
+            server.server_close()
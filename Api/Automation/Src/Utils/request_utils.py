@@ -10,17 +10,17 @@ Example:
 """
 
 import pytest
-import requests
 from Api.Automation.Src.Config.config import Config
+from Api.Automation.Src.Utils.transport_utils import CONNECTION_ERRORS, TIMEOUT_ERRORS, get_transport
 
-def safe_request(method, url, **kwargs):
+def safe_request(method, url, transport=None, **kwargs):
     """Send HTTP request with error handling & return status, data."""
     try:
-        resp = requests.request(method, url, timeout=Config.REQUEST_TIMEOUT, **kwargs)
+        resp = get_transport(transport).request(method, url, timeout=Config.REQUEST_TIMEOUT, **kwargs)
         return resp.status_code, resp.json() if resp.text else resp.text
-    except requests.exceptions.Timeout:
+    except TIMEOUT_ERRORS:
         pytest.fail(f"Timeout: {url}")
-    except requests.exceptions.ConnectionError as e:
+    except CONNECTION_ERRORS as e:
         pytest.fail(f"Connection failed: {url} - {e}")
     except ValueError:  # JSON parsing failed
         return resp.status_code, resp.text
@@ -0,0 +1,121 @@
+"""
+HTTP Transports
+---------------
+Pluggable transports for the request helpers and the load engine:
+- "http1": plain `requests` (one HTTP/1.1 connection per call, current behaviour)
+- "http2": a small pool of HTTP/2 connections (httpx), each multiplexing up to
+           Config.H2_STREAMS_PER_CONNECTION concurrent requests
+
+HTTP/2 needs the optional `httpx[http2]` package. Plain http:// base URLs use h2c
+prior knowledge, https:// negotiates HTTP/2 through ALPN.
+
+Example:
+    transport = get_transport("http2")
+    resp = transport.request("post", url, json=payload, headers=Config.HEADERS, timeout=10)
+"""
+
+import itertools
+import threading
+
+import requests
+from Api.Automation.Src.Config.config import Config
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+TRANSPORTS = ("http1", "http2")
+
+# Exception groups safe_request can catch regardless of the transport in use
+TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if httpx else ())
+CONNECTION_ERRORS = (requests.exceptions.ConnectionError,) + ((httpx.TransportError,) if httpx else ())
+
+
+class Http1Transport:
+    """HTTP/1.1 through `requests`, exactly like the original helpers."""
+
+    name = "http1"
+
+    def request(self, method, url, **kwargs):
+        return requests.request(method, url, **kwargs)
+
+    def close(self):
+        pass
+
+
+class Http2Transport:
+    """Multiplexes concurrent requests over `connections` HTTP/2 connections."""
+
+    name = "http2"
+
+    def __init__(self, connections=None, streams_per_connection=None, prior_knowledge=None):
+        if httpx is None:
+            raise ImportError("HTTP/2 transport needs httpx: pip install 'httpx[http2]'")
+        connections = connections or Config.H2_CONNECTIONS
+        self.streams_per_connection = streams_per_connection or Config.H2_STREAMS_PER_CONNECTION
+        if prior_knowledge is None:
+            prior_knowledge = (Config.BASE_URL or "").startswith("http://")
+
+        # max_connections=1 pins each client to a single connection; concurrent
+        # requests on it become HTTP/2 streams instead of new sockets
+        self.clients = [
+            httpx.Client(http1=not prior_knowledge, http2=True, timeout=None,
+                         limits=httpx.Limits(max_connections=1, max_keepalive_connections=1))
+            for _ in range(connections)
+        ]
+        self._slots = [threading.BoundedSemaphore(self.streams_per_connection) for _ in self.clients]
+        self._next = itertools.count()
+
+    def _acquire(self):
+        """Pick a connection with a free stream slot, starting round-robin; block if all are full."""
+        start = next(self._next) % len(self.clients)
+        for offset in range(len(self.clients)):
+            idx = (start + offset) % len(self.clients)
+            if self._slots[idx].acquire(blocking=False):
+                return idx
+        self._slots[start].acquire()
+        return start
+
+    def request(self, method, url, **kwargs):
+        idx = self._acquire()
+        try:
+            return self.clients[idx].request(method.upper(), url, **kwargs)
+        finally:
+            self._slots[idx].release()
+
+    def close(self):
+        for client in self.clients:
+            client.close()
+
+
+def http_version(resp):
+    """Negotiated protocol of a requests or httpx response, e.g. "HTTP/1.1" or "HTTP/2"."""
+    version = getattr(resp, "http_version", None)  # httpx
+    if version:
+        return version
+    raw_version = getattr(getattr(resp, "raw", None), "version", None)  # urllib3: 10 / 11
+    return {10: "HTTP/1.0", 11: "HTTP/1.1"}.get(raw_version, "unknown")
+
+
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(name=None):
+    """Return the shared transport for `name` (default Config.HTTP_TRANSPORT)."""
+    name = name or Config.HTTP_TRANSPORT
+    if name not in TRANSPORTS:
+        raise ValueError(f"Invalid transport: {name} (expected one of {', '.join(TRANSPORTS)})")
+    with _transports_lock:
+        if name not in _transports:
+            _transports[name] = Http2Transport() if name == "http2" else Http1Transport()
+        return _transports[name]
+
+
+def close_transports():
+    """Close shared transports created by get_transport (called at session end from conftest)."""
+    with _transports_lock:
+        for transport in _transports.values():
+            transport.close()
+        _transports.clear()
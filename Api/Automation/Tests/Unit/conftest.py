@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def authenticate():
+    """Unit tests exercise the harness utilities only - no live login needed."""
+    yield
@@ -0,0 +1,82 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from Api.Automation.Src.Utils.compression_utils import ENCODINGS, benchmark_endpoint, decompress, find_issues
+
+BODY = json.dumps({"data": [{"id": i, "name": "Category"} for i in range(300)]}).encode()
+
+
+def _result(encoding, content_encoding, wire_bytes, decoded_bytes=len(BODY), status=200, endpoint="list_categories"):
+    return {"endpoint": endpoint, "encoding": encoding, "content_encoding": content_encoding, "status": status,
+            "wire_bytes": wire_bytes, "decoded_bytes": decoded_bytes, "server_ms": 1.0, "decompress_ms": 0.1}
+
+
+class TestDecompress:
+    """Decoding raw bodies per Content-Encoding."""
+
+    @pytest.mark.parametrize("content_encoding, raw", [
+        ("identity", BODY),
+        ("", BODY),
+        ("gzip", gzip.compress(BODY)),
+        ("deflate", zlib.compress(BODY)),
+        ("deflate", zlib.compress(BODY)[2:-4]),  # raw deflate without the zlib header
+    ], ids=["identity", "empty", "gzip", "deflate", "raw-deflate"])
+    def test_round_trip(self, content_encoding, raw):
+        assert decompress(raw, content_encoding) == BODY
+
+    def test_unsupported_encoding_raises(self):
+        with pytest.raises(ValueError, match="Unsupported Content-Encoding"):
+            decompress(BODY, "compress")
+
+
+class TestFindIssues:
+    """Flagging of uncompressed and over-budget payloads."""
+
+    def test_compressed_within_budget_is_clean(self):
+        results = [_result("identity", "identity", len(BODY)), _result("gzip", "gzip", 900),
+                   _result("deflate", "identity", len(BODY))]  # deflate unsupported is not an issue
+        assert find_issues(results, size_budget=10000, min_compress_size=1024) == []
+
+    def test_never_compressed_is_flagged(self):
+        results = [_result(encoding, "identity", len(BODY)) for encoding in ("identity", "gzip", "deflate")]
+        issues = find_issues(results, size_budget=10 ** 6, min_compress_size=1024)
+        assert len(issues) == 1 and "ignores compression" in issues[0]
+
+    def test_small_uncompressed_body_is_not_flagged(self):
+        results = [_result(encoding, "identity", 200, 200) for encoding in ("identity", "gzip")]
+        assert find_issues(results, size_budget=10 ** 6, min_compress_size=1024) == []
+
+    def test_best_wire_size_over_budget_is_flagged(self):
+        results = [_result("identity", "identity", len(BODY)), _result("gzip", "gzip", 900)]
+        issues = find_issues(results, size_budget=500, min_compress_size=1024)
+        assert issues == ["list_categories: 900 bytes on the wire (best: gzip) exceeds budget of 500 bytes"]
+
+    def test_error_bodies_are_not_judged(self):
+        results = [_result(encoding, "identity", len(BODY), status=404) for encoding in ("identity", "gzip")]
+        assert find_issues(results, size_budget=100, min_compress_size=1024) == []
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    pytest.importorskip("h2")
+    from Api.Automation.Src.Utils.stand_in_server_utils import stand_in_server
+    with stand_in_server(latency=0) as server:
+        yield server
+
+
+class TestStandInBenchmark:
+    """End-to-end benchmark against the compression-aware local stand-in."""
+
+    def test_list_categories_is_compressed(self, stand_in):
+        results = [benchmark_endpoint("list_categories", encoding, base_url=stand_in.base_url)
+                   for encoding in ENCODINGS]
+        by_encoding = {r["encoding"]: r for r in results}
+
+        assert by_encoding["gzip"]["content_encoding"] == "gzip"
+        assert by_encoding["deflate"]["content_encoding"] == "deflate"
+        assert by_encoding["gzip"]["wire_bytes"] < by_encoding["identity"]["wire_bytes"]
+        assert by_encoding["gzip"]["decoded_bytes"] == by_encoding["identity"]["wire_bytes"]
+        assert find_issues(results, size_budget=10 ** 6) == []
+        assert find_issues(results, size_budget=100), "Over-budget payload should be flagged"
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from collections import Counter
+
+import pytest
+from Api.Automation.Src.Utils.cpu_profile_utils import (HARNESS_ROOT, HTTP_CLIENT_LABEL, CpuProfilePlugin,
+                                                        StackSampler, classify_stack, harness_hotspot)
+
+PRINT_UTILS = os.path.join(HARNESS_ROOT, "Src", "Utils", "print_api_utils.py")
+TEST_FILE = os.path.join(HARNESS_ROOT, "Tests", "test_login.py")
+HTTPCORE_SYNC = "/venv/lib/python3.11/site-packages/httpcore/_backends/sync.py"
+HTTPCORE_H2 = "/venv/lib/python3.11/site-packages/httpcore/_sync/http2.py"
+TRANSPORT = os.path.join(HARNESS_ROOT, "Src", "Utils", "transport_utils.py")
+
+
+class TestClassifyStack:
+    """Bucketing of sampled stacks into cpu / socket / idle."""
+
+    @pytest.mark.parametrize("stack, expected", [
+        ([("/usr/lib/python3.11/socket.py", "readinto"), (TEST_FILE, "test_x")], "socket"),
+        ([("/usr/lib/python3.11/ssl.py", "recv_into"), (TEST_FILE, "test_x")], "socket"),
+        ([("/venv/urllib3/util/connection.py", "create_connection")], "socket"),
+        ([(HTTPCORE_SYNC, "read"), (HTTPCORE_H2, "_read_incoming_data")], "socket"),
+        ([("/usr/lib/python3.11/threading.py", "wait"), (TEST_FILE, "test_x")], "idle"),
+        ([(PRINT_UTILS, "print_api_response"), (TEST_FILE, "test_x")], "cpu"),
+    ])
+    def test_leaf_frame(self, stack, expected):
+        assert classify_stack(stack) == expected
+
+    def test_low_cpu_with_network_frame_is_socket_wait(self):
+        """A blocking C-level recv below an HTTP client frame counts as socket wait, not idle."""
+        stack = [(HTTPCORE_H2, "_read_incoming_data"), (HTTPCORE_SYNC, "read"), (TEST_FILE, "test_x")]
+        assert classify_stack(stack, cpu_delta=0.0, interval=0.005) == "socket"
+
+    def test_low_cpu_without_network_frame_is_idle(self):
+        assert classify_stack([(TEST_FILE, "test_x")], cpu_delta=0.0, interval=0.005) == "idle"
+
+    def test_busy_thread_is_cpu(self):
+        assert classify_stack([(TEST_FILE, "test_x")], cpu_delta=0.005, interval=0.005) == "cpu"
+
+
+class TestHarnessHotspot:
+    def test_http_client_cpu_is_not_credited_to_the_transport_wrapper(self):
+        stack = [(HTTPCORE_H2, "_send_request_headers"), ("/venv/httpx/_client.py", "send"),
+                 (TRANSPORT, "request"), (TEST_FILE, "test_x")]
+        assert harness_hotspot(stack) == HTTP_CLIENT_LABEL
+
+    def test_library_leaf_is_credited_to_calling_harness_frame(self):
+        stack = [("/usr/lib/python3.11/json/encoder.py", "iterencode"), (PRINT_UTILS, "print_api_response"),
+                 (TEST_FILE, "test_x")]
+        assert harness_hotspot(stack) == f"{os.path.join('Src', 'Utils', 'print_api_utils.py')}:print_api_response"
+
+
+class TestStackSampler:
+    def test_harness_helper_threads_are_not_sampled(self):
+        stop = threading.Event()
+
+        def stand_in_loop():
+            stop.wait()
+
+        helper = threading.Thread(target=stand_in_loop, name="stand-in-server", daemon=True)
+        helper.start()
+        sampler = StackSampler(0.001)
+        sampler.start()
+        time.sleep(0.05)
+        sampler.stop()
+        stop.set()
+        helper.join()
+
+        sampled = {name for (_, stack), _ in sampler.stacks.items() for _, name in stack}
+        assert "test_harness_helper_threads_are_not_sampled" in sampled  # the test's own thread
+        assert "stand_in_loop" not in sampled and "_run" not in sampled
+
+    def test_buckets_are_reported_in_seconds(self):
+        sampler = StackSampler(0.01)
+        sampler.stacks = Counter({("socket", ()): 30, ("idle", ()): 5, ("cpu", ()): 2})
+        assert sampler.seconds("socket") == pytest.approx(0.3)
+        assert sampler.seconds("idle") == pytest.approx(0.05)
+
+
+class TestCollapsedLines:
+    """Flamegraph collapsed-stack output."""
+
+    def test_trims_to_outermost_harness_frame_and_prefixes_bucket(self):
+        plugin = CpuProfilePlugin("unused.folded", 0.005)
+        stack = (
+            ("/usr/lib/python3.11/json/encoder.py", "iterencode"),
+            (PRINT_UTILS, "print_api_response"),
+            (TEST_FILE, "test_login_empty_body"),
+            ("/venv/_pytest/python.py", "pytest_pyfunc_call"),
+        )
+        plugin.profiles["Tests/test_login.py::TestLoginAPI::test_login_empty_body"] = {
+            "wall": 1.0, "cpu": 0.5, "stacks": Counter({("cpu", stack): 7}),
+        }
+
+        lines = list(plugin.collapsed_lines())
+        assert lines == [
+            "Tests/test_login.py::TestLoginAPI::test_login_empty_body;cpu;"
+            f"{os.path.join('Tests', 'test_login.py')}:test_login_empty_body;"
+            f"{os.path.join('Src', 'Utils', 'print_api_utils.py')}:print_api_response;"
+            "encoder.py:iterencode 7"
+        ]
+
+    def test_sanitizes_separators_in_test_ids(self):
+        plugin = CpuProfilePlugin("unused.folded", 0.005)
+        plugin.profiles["test_x[a b;c]"] = {
+            "wall": 1.0, "cpu": 0.5, "stacks": Counter({("idle", (("/usr/lib/threading.py", "wait"),)): 2}),
+        }
+        assert list(plugin.collapsed_lines()) == ["test_x[a_b_c];idle;threading.py:wait 2"]
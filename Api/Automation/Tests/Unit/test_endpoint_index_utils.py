@@ -0,0 +1,165 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from Api.Automation.Src.Config.config import Config
+from Api.Automation.Src.Utils import endpoint_index_utils
+from Api.Automation.Src.Utils.cpu_profile_utils import HARNESS_ROOT, HTTP_CLIENT_LABEL, harness_hotspot
+from Api.Automation.Src.Utils.endpoint_index_utils import EndpointIndexPlugin, expand_changed, match_endpoint
+
+BASE = Config.BASE_URL.rstrip("/")
+CATEGORY_ID_URL = BASE + Config.ENDPOINTS["update_category"].format(id="abc123")
+
+
+def _item(nodeid, fixturenames=()):
+    return SimpleNamespace(nodeid=nodeid, fixturenames=list(fixturenames))
+
+
+def _plugin(tmp_path, index=None, **kwargs):
+    path = tmp_path / "index.json"
+    if index is not None:
+        path.write_text(json.dumps(index))
+    return EndpointIndexPlugin(str(path), **kwargs)
+
+
+INDEX = {
+    "fixtures": {"authenticate": ["login"]},
+    "tests": {
+        "test_login.py::test_a": {"endpoints": ["login"], "outcome": "passed"},
+        "test_category.py::test_list": {"endpoints": ["list_categories", "login"], "outcome": "passed"},
+        "test_category.py::test_update": {"endpoints": ["login", "update_category"], "outcome": "failed"},
+    },
+}
+
+
+class TestMatchEndpoint:
+    """Mapping recorded URLs back to Config.ENDPOINTS keys."""
+
+    @pytest.mark.parametrize("method, url, expected", [
+        ("post", BASE + Config.ENDPOINTS["login"], ["login"]),
+        ("POST", BASE + Config.ENDPOINTS["list_categories"] + "?page=2", ["list_categories"]),
+        ("post", BASE + Config.ENDPOINTS["create_category"], ["create_category"]),
+        ("put", CATEGORY_ID_URL, ["update_category"]),
+        ("delete", CATEGORY_ID_URL, ["delete_category"]),
+        ("get", CATEGORY_ID_URL, ["protected_endpoint"]),
+        ("post", BASE + "/v1/unknown", []),
+        ("post", "http://127.0.0.1:8080" + Config.ENDPOINTS["login"], []),  # local stand-in, not the live API
+    ])
+    def test_match(self, method, url, expected):
+        assert match_endpoint(method, url) == expected
+
+    def test_unexpected_method_keeps_all_path_matches(self):
+        """e.g. PATCH on category/{id} touches every key sharing that path."""
+        assert sorted(match_endpoint("patch", CATEGORY_ID_URL)) == \
+            ["delete_category", "protected_endpoint", "update_category"]
+
+
+class TestHttp2Recording:
+    def test_hooked_transport_call_is_credited(self, monkeypatch):
+        monkeypatch.setattr(endpoint_index_utils, "_original_h2_request", lambda transport, method, url, **kw: "resp")
+        sink = set()
+        endpoint_index_utils._active_sinks.append(sink)
+        try:
+            resp = endpoint_index_utils._recording_h2_request(None, "post", BASE + Config.ENDPOINTS["login"])
+        finally:
+            endpoint_index_utils._active_sinks.pop()
+        assert resp == "resp" and sink == {"login"}
+
+
+class TestExpandChanged:
+    def test_services_expand_to_endpoints(self):
+        assert expand_changed(endpoints=["login"], services=["category"]) == {"login", *Config.SERVICES["category"]}
+
+    @pytest.mark.parametrize("kwargs", [{"endpoints": ["nope"]}, {"services": ["nope"]}])
+    def test_unknown_names_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            expand_changed(**kwargs)
+
+
+class TestSelection:
+    """Deselecting unaffected tests from a recorded index."""
+
+    def _select(self, plugin, nodeids):
+        items = [_item(nodeid) for nodeid in nodeids]
+        deselected = []
+        config = SimpleNamespace(hook=SimpleNamespace(pytest_deselected=lambda items: deselected.extend(items)))
+        plugin.pytest_collection_modifyitems(None, config, items)
+        return [i.nodeid for i in items], [i.nodeid for i in deselected]
+
+    def test_changed_endpoint_selects_touching_tests_in_collection_order(self, tmp_path):
+        plugin = _plugin(tmp_path, INDEX, changed={"list_categories", "update_category"})
+        selected, deselected = self._select(plugin, list(INDEX["tests"]))
+        assert selected == ["test_category.py::test_list", "test_category.py::test_update"]
+        assert deselected == ["test_login.py::test_a"]
+        assert list(plugin.cached) == ["test_login.py::test_a"]
+
+    def test_unknown_tests_always_run(self, tmp_path):
+        plugin = _plugin(tmp_path, INDEX, changed={"update_category"})
+        selected, _ = self._select(plugin, ["test_new.py::test_b", "test_login.py::test_a"])
+        assert selected == ["test_new.py::test_b"]
+
+    def test_cached_failure_is_always_rerun(self, tmp_path):
+        plugin = _plugin(tmp_path, INDEX, changed={"list_categories"})
+        selected, _ = self._select(plugin, list(INDEX["tests"]))
+        assert selected == ["test_category.py::test_list", "test_category.py::test_update"]
+        assert all(entry["outcome"] == "passed" for entry in plugin.cached.values())
+
+    def test_select_failed(self, tmp_path):
+        plugin = _plugin(tmp_path, INDEX, select_failed=True)
+        selected, _ = self._select(plugin, list(INDEX["tests"]))
+        assert selected == ["test_category.py::test_update"]
+
+    def test_no_selection_options_runs_everything(self, tmp_path):
+        plugin = _plugin(tmp_path, INDEX)
+        selected, deselected = self._select(plugin, list(INDEX["tests"]))
+        assert selected == list(INDEX["tests"]) and deselected == []
+
+
+class TestIndexMerge:
+    """Persisting a run's recordings into the index."""
+
+    def _finish(self, plugin, nodeid, outcome, keys, fixturenames=("authenticate",)):
+        plugin.items = {nodeid: _item(nodeid, fixturenames)}
+        plugin.fixture_endpoints = {"authenticate": {"login"}}
+        plugin.test_endpoints = {nodeid: set(keys)}
+        plugin.outcomes = {nodeid: outcome}
+        plugin.pytest_sessionfinish(None)
+        return json.loads(open(plugin.index_path).read())["tests"][nodeid]
+
+    def test_failed_run_keeps_previously_recorded_endpoints(self, tmp_path):
+        """A test that failed before its later calls must stay selectable for them."""
+        index = {"fixtures": {}, "tests": {"t::test_update": {"endpoints": ["login", "update_category"],
+                                                              "outcome": "passed"}}}
+        entry = self._finish(_plugin(tmp_path, index), "t::test_update", "failed", [])
+        assert entry["endpoints"] == ["login", "update_category"]
+        assert entry["outcome"] == "failed"
+
+    def test_collect_only_leaves_index_untouched(self, tmp_path):
+        plugin = _plugin(tmp_path, record=False)
+        plugin.outcomes = {"t::test_a": "passed"}
+        plugin.pytest_sessionfinish(None)
+        assert not os.path.exists(plugin.index_path)
+
+    def test_passed_run_replaces_endpoints(self, tmp_path):
+        index = {"fixtures": {}, "tests": {"t::test_a": {"endpoints": ["logout"], "outcome": "passed"}}}
+        entry = self._finish(_plugin(tmp_path, index), "t::test_a", "passed", ["list_categories"])
+        assert entry["endpoints"] == ["list_categories", "login"]
+
+
+class TestProfilerInteraction:
+    def test_recording_wrapper_is_not_a_harness_hotspot(self):
+        stack = [
+            ("/venv/site-packages/urllib3/connectionpool.py", "urlopen"),
+            (os.path.join(HARNESS_ROOT, "Src", "Utils", "endpoint_index_utils.py"), "_recording_request"),
+            ("/venv/site-packages/requests/api.py", "request"),
+            (os.path.join(HARNESS_ROOT, "Src", "Services", "login_service.py"), "api_request"),
+        ]
+        assert harness_hotspot(stack) == HTTP_CLIENT_LABEL
+
+    def test_recorder_leaf_is_skipped(self):
+        stack = [
+            (os.path.join(HARNESS_ROOT, "Src", "Utils", "endpoint_index_utils.py"), "match_endpoint"),
+            (os.path.join(HARNESS_ROOT, "Src", "Utils", "print_api_utils.py"), "print_api_response"),
+        ]
+        assert harness_hotspot(stack) == f"{os.path.join('Src', 'Utils', 'print_api_utils.py')}:print_api_response"
@@ -0,0 +1,117 @@
+import io
+import threading
+import time
+from collections import Counter
+
+import pytest
+from Api.Automation.Src.Utils.metrics_utils import (LoadMetrics, RingBuffer, format_dashboard, format_prometheus,
+                                                     live_dashboard, percentile)
+
+
+class TestPercentile:
+    """Nearest-rank percentiles (round-half-even must not leak in)."""
+
+    @pytest.mark.parametrize("values, pct, expected", [
+        ([1, 2, 3, 4, 5], 50, 3),
+        (list(range(1, 10)), 50, 5),
+        (list(range(1, 151)), 99, 149),
+        (list(range(1, 101)), 99, 99),
+        (list(range(1, 101)), 100, 100),
+        ([7], 99, 7),
+        ([1, 2], 0, 1),
+        ([], 50, 0.0),
+    ])
+    def test_nearest_rank(self, values, pct, expected):
+        assert percentile(values, pct) == expected
+
+
+class TestRingBuffer:
+    def test_wraparound_keeps_latest_samples(self):
+        buf = RingBuffer(3)
+        for i in range(5):
+            buf.append(i)
+        assert buf.writes == 5
+        assert sorted(buf.slots) == [2, 3, 4]
+
+
+class TestLoadMetrics:
+    def test_snapshot_aggregates_workers(self):
+        metrics = LoadMetrics(buffer_size=16, window=60)
+
+        def worker(statuses):
+            for status in statuses:
+                started = metrics.start_request()
+                metrics.finish_request("login", status, started - 0.1)
+
+        threads = [threading.Thread(target=worker, args=([200, 200, 400],)),
+                   threading.Thread(target=worker, args=([200, "ConnectTimeout"],))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        metrics.start_request()  # still in flight
+
+        snap = metrics.snapshot()
+        assert snap["total"] == 5
+        assert snap["rps"] == 5
+        assert snap["in_flight"] == 1
+        assert snap["endpoints"]["login"]["count"] == 5
+        assert snap["endpoints"]["login"]["p50"] >= 0.1
+        assert snap["errors"] == Counter({400: 1, "ConnectTimeout": 1})
+
+    def test_totals_survive_ring_buffer_wraparound(self):
+        metrics = LoadMetrics(buffer_size=4, window=60)
+        for _ in range(10):
+            metrics.finish_request("login", 200, metrics.start_request())
+
+        snap = metrics.snapshot()
+        assert snap["total"] == 10  # counters never wrap
+        assert snap["endpoints"]["login"]["count"] == 4  # percentiles use the retained samples
+
+    def test_samples_outside_window_are_dropped(self):
+        metrics = LoadMetrics(buffer_size=8, window=5)
+        metrics._buffer().append((time.monotonic() - 10, "login", 200, 0.5))
+        metrics.finish_request("login", 200, metrics.start_request())
+
+        assert metrics.snapshot()["endpoints"]["login"]["count"] == 1
+
+
+class TestFormatPrometheus:
+    def test_exposition_format(self):
+        snap = {
+            "totals": Counter({("login", 200): 3, ("login", 400): 1}),
+            "in_flight": 2,
+            "rps": 4,
+            "endpoints": {"login": {"count": 4, "p50": 0.1, "p99": 0.25}},
+        }
+        assert format_prometheus(snap) == (
+            "# TYPE api_requests_total counter\n"
+            'api_requests_total{endpoint="login",status="200"} 3\n'
+            'api_requests_total{endpoint="login",status="400"} 1\n'
+            "# TYPE api_requests_in_flight gauge\n"
+            "api_requests_in_flight 2\n"
+            "# TYPE api_requests_per_second gauge\n"
+            "api_requests_per_second 4\n"
+            "# TYPE api_request_duration_seconds summary\n"
+            'api_request_duration_seconds{endpoint="login",quantile="0.5"} 0.100000\n'
+            'api_request_duration_seconds{endpoint="login",quantile="0.99"} 0.250000\n'
+        )
+
+
+class TestLiveDashboard:
+    def test_tty_redraw_only_rewrites_its_own_lines(self):
+        class FakeTerminal(io.StringIO):
+            def isatty(self):
+                return True
+
+        out = FakeTerminal()
+        metrics = LoadMetrics(buffer_size=8, window=60)
+        with live_dashboard(metrics, enabled=True, port=0, refresh=0.01, out=out):
+            metrics.finish_request("login", 200, metrics.start_request())
+            time.sleep(0.05)
+
+        frame_lines = format_dashboard(metrics.snapshot()).count("\n") + 1
+        written = out.getvalue()
+        assert "\x1b[2J" not in written and "\x1b[H" not in written  # never clears the whole screen
+        assert not written.startswith("\x1b[")  # first frame is drawn below existing output
+        assert f"\x1b[{frame_lines}F\x1b[J" in written
@@ -1,15 +1,55 @@
+import os
+
 import pytest
+from Api.Automation.Src.Config.config import Config
 from Api.Automation.Src.Utils.token_generate_utils import get_jwt_token
+from Api.Automation.Src.Utils.cpu_profile_utils import CpuProfilePlugin
+from Api.Automation.Src.Utils.endpoint_index_utils import EndpointIndexPlugin, expand_changed
+from Api.Automation.Src.Utils.transport_utils import close_transports
 
 # session-level storage
 SESSION_TOKEN = None
 
+def pytest_addoption(parser):
+    parser.addoption("--cpu-profile", action="store", default=None, metavar="PATH",
+                     help="Sample client-side CPU per test and write collapsed stacks to PATH")
+    parser.addoption("--changed-endpoints", action="store", default="", metavar="KEYS",
+                     help="Comma-separated Config.ENDPOINTS keys; run only tests that touch them")
+    parser.addoption("--changed-services", action="store", default="", metavar="NAMES",
+                     help="Comma-separated Config.SERVICES names; run only tests that touch their endpoints")
+    parser.addoption("--select-failed", action="store_true", default=False,
+                     help="Run tests that failed in the previous recorded run (always included "
+                          "when selecting by changed endpoints/services)")
+
+def pytest_configure(config):
+    profile_path = config.getoption("--cpu-profile")
+    if profile_path:
+        plugin = CpuProfilePlugin(profile_path, Config.CPU_PROFILE_INTERVAL, Config.CPU_PROFILE_TOP)
+        config.pluginmanager.register(plugin, "cpu_profile")
+
+    try:
+        changed = expand_changed(
+            endpoints=[key.strip() for key in config.getoption("--changed-endpoints").split(",") if key.strip()],
+            services=[name.strip() for name in config.getoption("--changed-services").split(",") if name.strip()],
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    index_path = os.path.join(str(config.rootpath), Config.ENDPOINT_INDEX_PATH)
+    index_plugin = EndpointIndexPlugin(index_path, changed, config.getoption("--select-failed"),
+                                       record=not config.getoption("collectonly"))
+    config.pluginmanager.register(index_plugin, "endpoint_index")
+
 @pytest.fixture(scope="session", autouse=True)
 def authenticate():
     global SESSION_TOKEN
     SESSION_TOKEN = get_jwt_token()  # auto-run, store token
     yield
 
+@pytest.fixture(scope="session", autouse=True)
+def shared_transports():
+    yield
+    close_transports()  # shared HTTP/2 clients from get_transport()
+
 @pytest.fixture(scope="session")
 def auth_token():
     return SESSION_TOKEN  # reuse same token
@@ -0,0 +1,22 @@
+import allure
+import pytest
+import traceback
+from Api.Automation.Src.Config.config import Config
+from Api.Automation.Src.Utils.compression_utils import ENCODINGS, benchmark_endpoint, find_issues, format_report
+
+
+class TestResponseCompression:
+    """Bytes-on-the-wire benchmark for every configured endpoint and Accept-Encoding."""
+
+    @pytest.mark.parametrize("endpoint_key", list(Config.ENDPOINTS))
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_endpoint_compression(self, endpoint_key):
+        """Endpoint honours compression and stays within the payload size budget."""
+        try:
+            results = [benchmark_endpoint(endpoint_key, encoding, headers=Config.HEADERS) for encoding in ENCODINGS]
+            print("\n" + format_report(results))
+
+            issues = find_issues(results)
+            assert not issues, "Compression issues:\n" + "\n".join(issues)
+        except Exception as e:
+            pytest.fail(f"Compression benchmark failed for {endpoint_key}: {e}\n{traceback.format_exc()}")
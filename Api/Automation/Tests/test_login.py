@@ -11,7 +11,8 @@ from Api.Automation.Src.Config.config import Config
 from Api.Automation.Src.Utils.print_api_utils import print_api_response
 from Api.Automation.Src.Utils.schema_validation_utils import validate_response_schema
 from Api.Automation.Src.Services.login_service import api_request, get_login_payload, build_url
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from Api.Automation.Src.Utils.metrics_utils import format_dashboard
+from Api.Automation.Src.Utils.load_utils import run_load, compare_transports, format_transport_comparison
 
 
 class TestLoginAPI:
@@ -163,41 +164,33 @@ class TestLoginAPI:
         The function measures time taken for each request and total execution.
         """
         try:
-            url = build_url()
             payload = get_login_payload()
-            results = []
-
-            def do_login(index):
-                start = time.time()
-                try:
-                    resp = requests.post(url, json=payload)
-                    duration = time.time() - start
-                    return index, resp.status_code, duration
-                except requests.RequestException as e:
-                    duration = time.time() - start
-                    return index, f"Error: {e}", duration
-                except Exception as e:
-                    duration = time.time() - start
-                    return index, f"Error: {e}", duration
-
-            start_all = time.time()
-            with ThreadPoolExecutor(max_workers=num_users) as executor:
-                futures = [executor.submit(do_login, i) for i in range(num_users)]
-                for future in as_completed(futures):
-                    try:
-                        idx, status, duration = future.result()
-                        results.append((idx, status, duration))
-                        print(f"Login {idx}: {status} (Time taken: {duration:.2f} sec)")
-                    except Exception as e:
-                        # capture any worker exception
-                        pytest.fail(f"Worker raised exception in test_parallel_logins_auto_timeout: {e}\n{traceback.format_exc()}")
-
-            total_time = time.time() - start_all
-            print(f"\nTotal time for {num_users} users: {total_time:.2f} sec")
+            results, total_time, metrics = run_load("post", build_url(), payload, num_requests=num_users,
+                                                    transport=Config.HTTP_TRANSPORT)
+
+            assert len(results) == num_users, f"Expected {num_users} results, got {len(results)}"
+            print(f"\n{format_dashboard(metrics.snapshot())}")
+            print(f"\nTotal time for {num_users} users ({Config.HTTP_TRANSPORT}): {total_time:.2f} sec")
         except Exception as e:
             pytest.fail(f"Unexpected error in test_parallel_logins_auto_timeout: {e}\n{traceback.format_exc()}")
 
 
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_parallel_logins_http1_vs_http2(self, num_users=50):
+        """Run the same parallel login scenario over HTTP/1.1 and multiplexed HTTP/2 and compare."""
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        try:
+            rows = compare_transports("post", build_url(), get_login_payload(), num_requests=num_users)
+            print("\n" + format_transport_comparison(rows))
+            assert all(row["requests"] == num_users for row in rows), f"Missing results: {rows}"
+            http2_row = next(row for row in rows if row["transport"] == "http2")
+            assert http2_row["http_versions"] == ["HTTP/2"], \
+                f"http2 transport negotiated {http2_row['http_versions']} - gateway fell back from HTTP/2"
+        except Exception as e:
+            pytest.fail(f"Unexpected error in test_parallel_logins_http1_vs_http2: {e}\n{traceback.format_exc()}")
+
+
     @allure.feature("Authentication")
     @allure.story("Login")
     @allure.severity(allure.severity_level.CRITICAL)
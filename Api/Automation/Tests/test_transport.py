@@ -0,0 +1,106 @@
+import allure
+import pytest
+import traceback
+from Api.Automation.Src.Config.config import Config
+from Api.Automation.Src.Services.login_service import get_login_payload
+from Api.Automation.Src.Utils.load_utils import run_load, compare_transports, format_transport_comparison
+from Api.Automation.Src.Utils.transport_utils import Http1Transport, Http2Transport
+from Api.Automation.Src.Utils.stand_in_server_utils import STAND_IN_CATEGORIES, stand_in_server
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def authenticate():
+    """The stand-in needs no token - skip the live login so this module runs offline."""
+    yield
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    """Local HTTP/1.1 + h2c stand-in API, so transport behaviour is tested without the live gateway."""
+    with stand_in_server(latency=0.05) as server:
+        yield server
+
+
+class TestHttp2Transport:
+    """HTTP/2 multiplexing vs. one HTTP/1.1 connection per request, against the local stand-in."""
+
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_http2_multiplexes_over_few_connections(self, stand_in, num_requests=50):
+        """Concurrent HTTP/2 requests share H2_CONNECTIONS sockets instead of one each."""
+        transport = Http2Transport(connections=2, streams_per_connection=25, prior_knowledge=True)
+        try:
+            url = stand_in.base_url + Config.ENDPOINTS["login"]
+            opened_before = stand_in.connections
+            results, total_time, _ = run_load("post", url, get_login_payload(), num_requests=num_requests,
+                                              transport=transport)
+
+            statuses = [status for _, status, _ in results]
+            assert statuses == [200] * num_requests, f"Unexpected statuses: {statuses}"
+            assert stand_in.connections - opened_before <= 2, \
+                f"Expected at most 2 connections, server saw {stand_in.connections - opened_before}"
+            resp = transport.request("post", url, json=get_login_payload())
+            assert resp.http_version == "HTTP/2", f"Expected HTTP/2, got {resp.http_version}"
+            print(f"\n{num_requests} HTTP/2 requests in {total_time:.2f} sec over "
+                  f"{stand_in.connections - opened_before} connection(s)")
+        except Exception as e:
+            pytest.fail(f"Unexpected error in test_http2_multiplexes_over_few_connections: {e}\n{traceback.format_exc()}")
+        finally:
+            transport.close()
+
+
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_http2_respects_streams_per_connection(self, stand_in, num_requests=20):
+        """With one connection and 5 streams, 20 requests of 50 ms need at least 4 rounds."""
+        transport = Http2Transport(connections=1, streams_per_connection=5, prior_knowledge=True)
+        try:
+            url = stand_in.base_url + Config.ENDPOINTS["login"]
+            results, total_time, _ = run_load("post", url, get_login_payload(), num_requests=num_requests,
+                                              transport=transport)
+
+            assert all(status == 200 for _, status, _ in results), f"Unexpected results: {results}"
+            assert total_time >= 4 * stand_in.latency, f"Stream limit not applied: {total_time:.2f} sec"
+        except Exception as e:
+            pytest.fail(f"Unexpected error in test_http2_respects_streams_per_connection: {e}\n{traceback.format_exc()}")
+        finally:
+            transport.close()
+
+
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_http2_large_uncompressed_body(self, stand_in):
+        """A body larger than one 16 KB HTTP/2 frame is split into frames and arrives complete."""
+        transport = Http2Transport(connections=1, prior_knowledge=True)
+        try:
+            url = stand_in.base_url + Config.ENDPOINTS["list_categories"]
+            resp = transport.request("post", url, json={}, headers={"Accept-Encoding": "identity"}, timeout=10)
+
+            assert resp.status_code == 200, f"Unexpected status: {resp.status_code}"
+            assert resp.http_version == "HTTP/2", f"Expected HTTP/2, got {resp.http_version}"
+            assert "content-encoding" not in resp.headers
+            assert len(resp.content) > 16384, f"Body too small to need several frames: {len(resp.content)} bytes"
+            assert len(resp.json()["data"]["categories"]) == STAND_IN_CATEGORIES
+        except Exception as e:
+            pytest.fail(f"Unexpected error in test_http2_large_uncompressed_body: {e}\n{traceback.format_exc()}")
+        finally:
+            transport.close()
+
+
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_http1_vs_http2_benchmark(self, stand_in, num_requests=50):
+        """Same scenario over both transports; print the comparison."""
+        transport = Http2Transport(connections=2, prior_knowledge=True)
+        try:
+            url = stand_in.base_url + Config.ENDPOINTS["login"]
+            rows = compare_transports("post", url, get_login_payload(), num_requests=num_requests,
+                                      transports=(Http1Transport(), transport))
+            print("\n" + format_transport_comparison(rows))
+
+            assert [row["transport"] for row in rows] == ["http1", "http2"]
+            assert [row["http_versions"] for row in rows] == [["HTTP/1.1"], ["HTTP/2"]], f"Protocols: {rows}"
+            assert all(row["errors"] == 0 for row in rows), f"Errors during benchmark: {rows}"
+        except Exception as e:
+            pytest.fail(f"Unexpected error in test_http1_vs_http2_benchmark: {e}\n{traceback.format_exc()}")
+        finally:
+            transport.close()
@@ -6,8 +6,10 @@ if __name__ == "__main__":
     print("1. Login tests only")
     print("2. Category tests only")
     print("3. All tests")
+    print("4. Compression benchmark only")
+    print("5. Affected tests only (changed endpoints/services or last failures)")
 
-    choice = input("Enter your choice (1/2/3): ").strip()
+    choice = input("Enter your choice (1/2/3/4/5): ").strip()
 
     html_report = "./report.html"  # report file path
 
@@ -17,6 +19,15 @@ if __name__ == "__main__":
         exit_code = pytest.main(["-v", "./Api/Automation/Tests/test_category.py", f"--html={html_report}"])
     elif choice == "3":
         exit_code = pytest.main(["-v", "./Api/Automation/Tests/", f"--html={html_report}"])
+    elif choice == "4":
+        exit_code = pytest.main(["-v", "-s", "./Api/Automation/Tests/test_compression.py", f"--html={html_report}"])
+    elif choice == "5":
+        endpoints = input("Changed endpoint keys (comma-separated, blank for none): ").strip()
+        services = input("Changed services (comma-separated, blank for none): ").strip()
+        failed = input("Nothing changed - rerun last run's failures only? (y/n): ").strip().lower() == "y"
+        args = ["-v", "./Api/Automation/Tests/", f"--html={html_report}",
+                f"--changed-endpoints={endpoints}", f"--changed-services={services}"]
+        exit_code = pytest.main(args + (["--select-failed"] if failed else []))
     else:
         print("Invalid choice")
         sys.exit(1)